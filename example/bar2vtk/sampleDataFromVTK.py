@@ -16,15 +16,16 @@ vtmPath = Path('result/exampleMesh_10000.vtm')
 
 # Reading in data
 dataBlock = pv.MultiBlock(vtmPath.as_posix())
+wall = dataBlock['wall']
 
 # ---- Calculating Cf profile
 Uref = 16.4
 nu = 1.5E-5
 rho = 1
     # Save Cf values to numpy array
-Cf = vpt.calcCf(dataBlock['wall'], Uref=Uref, nu=nu, rho=rho)
-    # Or save them directly to the wall
-dataBlock['wall']['Cf'] = vpt.calcCf(dataBlock['wall'], Uref=Uref, nu=nu, rho=rho)
+Cf = vpt.calcCf(wall, Uref=Uref, nu=nu, rho=rho)
+    # And/or save them directly to the wall
+wall['Cf'] = Cf
 
 # ---- Extracting Profiles from dataBlock files
 
@@ -37,7 +38,7 @@ line_walldists = vpt.getGeometricSeries(line_height, line_initpoint, line_growth
 
 ## Extract profiles by pointid, using the closest wall point to a given location
 example_profile = vpt.sampleDataBlockProfile(dataBlock, line_walldists,
-                                         pointid=dataBlock['wall'].find_closest_point([-0.4,0,0]))
+                                         pointid=wall.find_closest_point([-0.4,0,0]))
 
 ## Extract profiles by specifying an plane intersection using vtkCutter
 plane = vtk.vtkPlane()
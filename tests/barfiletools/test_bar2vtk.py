@@ -1,6 +1,8 @@
 import pytest
 from unittest import TestCase
 import shutil, os, sys
+import numpy as np
+from scipy.io import FortranFile
 
 import vtkpytools as vpt
 from pathlib import Path, PurePath
@@ -45,3 +47,15 @@ def test_bar2vtk_fileGlobbing(fixture_bar2vtk_exampledata, tmp_path):
     for testString in ['velbar', 'stsbar']:
         (tmp_path / 'data/{}.100000.1'.format(testString)).touch()
     vpt.bar2vtk_main('cli result/exampleMesh.vtm data 10000'.split(' '))
+
+def test_getBarData_timewindow(tmp_path):
+    velbar = vpt.binaryVelbar(FIXTURE_DIR / '../../example/bar2vtk/data/velbar.10000.1')
+    with FortranFile(tmp_path / 'velbar.10000.1', 'w') as file:
+        file.write_record(velbar.flatten())
+    with FortranFile(tmp_path / 'velbar.20000.1', 'w') as file:
+        file.write_record(2*velbar.flatten())
+
+    barArray, barPaths = vpt.barfiletools.bar2vtk.getBarData([], '10000-20000', tmp_path,
+                                                             vpt.binaryVelbar, 0, 'velbar')
+    assert len(barPaths) == 2
+    assert np.allclose(barArray, 3*velbar)
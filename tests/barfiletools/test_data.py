@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+import pyvista as pv
+
+import vtkpytools as vpt
+
+@pytest.fixture
+def barArrays():
+    rng = np.random.default_rng(0)
+    velbar = rng.random((10, 5))
+    stsbar = rng.random((10, 6))
+    return stsbar, velbar
+
+
+@pytest.mark.parametrize('chunksize', [3, 2**16])
+def test_calcReynoldsStresses(barArrays, chunksize):
+    stsbar, velbar = barArrays
+    solution = np.array([
+        stsbar[:,0] - velbar[:,1]**2,
+        stsbar[:,1] - velbar[:,2]**2,
+        stsbar[:,2] - velbar[:,3]**2,
+        stsbar[:,3] - velbar[:,1]*velbar[:,2],
+        stsbar[:,4] - velbar[:,1]*velbar[:,3],
+        stsbar[:,5] - velbar[:,2]*velbar[:,3],
+                        ]).T
+
+    ReyStrTensor = vpt.calcReynoldsStresses(stsbar, velbar, chunksize=chunksize)
+    assert ReyStrTensor.shape == (velbar.shape[0], 6)
+    assert np.allclose(ReyStrTensor, solution)
+
+
+@pytest.mark.parametrize('compute_col5', [True, False])
+def test_calcReynoldsStresses_conservative(barArrays, compute_col5):
+    _, velbar = barArrays
+    stsbar = np.random.default_rng(1).random((velbar.shape[0], 9))
+    solution = np.array([
+        stsbar[:,3] - stsbar[:,0]**2,
+        stsbar[:,4] - stsbar[:,1]**2,
+        stsbar[:,5] - stsbar[:,2]**2,
+        stsbar[:,6] - stsbar[:,0]*stsbar[:,1],
+        stsbar[:,7] - stsbar[:,1]*stsbar[:,2],
+        stsbar[:,8] - stsbar[:,0]*stsbar[:,2],
+                        ]).T
+    if not compute_col5:
+        solution[:,5] = 0
+
+    ReyStrTensor = vpt.calcReynoldsStresses(stsbar, velbar, conservative_stresses=True,
+                                            compute_col5=compute_col5, chunksize=3)
+    assert np.allclose(ReyStrTensor, solution)
+
+
+@pytest.mark.parametrize('plane_normal', ['XY', 'XZ', 'YZ'])
+def test_calcCf(plane_normal):
+    """Compare against projecting with n x (T_w x n) and the original streamwise vectors"""
+    rng = np.random.default_rng(2)
+    normals = rng.random((10, 3)) - 0.5
+    normals /= np.linalg.norm(normals, axis=1)[:,None]
+    wall = pv.PolyData(rng.random((10, 3)))
+    wall['Normals'] = normals
+    wall['gradient'] = rng.random((10, 9))
+    Uref, nu, rho = 2.0, 1.5e-5, 1.2
+
+    if plane_normal == 'XY':
+        axis = np.array([0, 0, 1])
+        streamwise = np.array([normals[:,1], -normals[:,0], np.zeros(10)]).T
+    else:
+        axis = np.array([0, 1, 0]) if plane_normal == 'XZ' else np.array([1, 0, 0])
+        streamwise = np.array([normals[:,2], np.zeros(10), -normals[:,0]]).T
+
+    wall_shear_gradient = vpt.calcWallShearGradient(wall)
+    Tw = nu*rho * np.cross(axis[None,:], np.cross(wall_shear_gradient, axis[None,:]))
+    solution = np.einsum('ej,ej->e', streamwise, Tw) / (0.5*rho*Uref**2)
+
+    assert np.allclose(vpt.calcCf(wall, Uref, nu, rho, plane_normal), solution)
+
+
+def test_calcWallShearGradient():
+    rng = np.random.default_rng(3)
+    normals = rng.random((10, 3)) - 0.5
+    normals /= np.linalg.norm(normals, axis=1)[:,None]
+    wall = pv.PolyData(rng.random((10, 3)))
+    wall['Normals'] = normals
+    wall['gradient'] = rng.random((10, 9))
+
+    grad_tensors = wall['gradient'].reshape(10, 3, 3)
+    traction_vector = np.einsum('pkj,pj->pk', grad_tensors, normals)
+    del_ik_nkni = np.identity(3) - np.einsum('pk,pi->pki', normals, normals)
+    solution = np.einsum('pik,pk->pi', del_ik_nkni, traction_vector)
+
+    assert np.allclose(vpt.calcWallShearGradient(wall), solution)
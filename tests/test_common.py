@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+from scipy.io import FortranFile
 
 import vtkpytools as vpt
 from pathlib import Path
@@ -22,3 +24,23 @@ def test_globFile_regex(createGlobFiles, tmp_path):
     print(list(tmp_path.iterdir()))
     vpt.globFile(r'^velbar\.200(?![\d|-]).*$', tmp_path, regex=True)
 
+
+@pytest.mark.parametrize('ncols', [5, 6])
+def test_readBinaryArray(tmp_path, ncols):
+    array = np.arange(4*ncols, dtype=np.float64).reshape(4, ncols)
+    path = tmp_path / Path('bar.1')
+    with FortranFile(path, 'w') as file:
+        file.write_record(array.flatten())
+
+    result = vpt.common.readBinaryArray(path, ncols)
+    assert result.shape == array.shape
+    assert np.array_equal(result, array)
+
+def test_readBinaryArray_truncated(tmp_path):
+    path = tmp_path / Path('bar.1')
+    with FortranFile(path, 'w') as file:
+        file.write_record(np.arange(10, dtype=np.float64))
+    path.write_bytes(path.read_bytes()[:-12])
+
+    with pytest.raises(RuntimeError):
+        vpt.common.readBinaryArray(path, 5)
@@ -124,3 +124,30 @@ def test_seriesDiffLimiter_error(kwargs):
     series = np.array([0, 1, 2, 4, 8])
     with pytest.raises(RuntimeError):
         vpt.seriesDiffLimiter(series, **kwargs)
+
+
+@pytest.mark.parametrize('shape', [(2,3), (2,6), (2,9), (2,3,3)])
+def test_rotateTensor(twoFullTensors, shape):
+    rotation_tensor = vpt.makeRotationTensor(np.array([0, 0, 1]), np.pi/3)
+    full = twoFullTensors.reshape(2,3,3)
+    full = 0.5*(full + full.transpose(0,2,1))
+    rotated = np.array([rotation_tensor @ tensor @ rotation_tensor.T for tensor in full])
+
+    if shape == (2,3):
+        tensor_array, solution = full[:,0,:], full[:,0,:] @ rotation_tensor.T
+    elif shape == (2,6):
+        tensor_array, solution = vpt.full2SymmetricTensor(full), vpt.full2SymmetricTensor(rotated)
+    else:
+        tensor_array, solution = full.reshape(shape), rotated.reshape(shape)
+
+    assert np.allclose(vpt.rotateTensor(tensor_array, rotation_tensor), solution)
+
+
+@pytest.mark.parametrize('include_zero', [True, False])
+def test_getGeometricSeries(include_zero):
+    series = vpt.getGeometricSeries(1.0, 0.01, 1.1, include_zero=include_zero)
+    dxs = np.diff(series)
+
+    assert series[-1] == 1.0
+    assert series[0] == (0.0 if include_zero else 0.01)
+    assert np.allclose(dxs[1:-1]/dxs[:-2], 1.1)
@@ -3,6 +3,7 @@ import pytomlpp
 import pyvista as pv
 import numpy as np
 from pathlib import Path, PurePath
+from concurrent.futures import ThreadPoolExecutor
 
 from .data import binaryVelbar, binaryStsbar, calcReynoldsStresses
 from ..common import globFile, readBinaryArray
@@ -269,12 +270,20 @@ def getBarData(_bar: list, timestep_str: str, barfiledir: Path, _barReader,
             _barPaths = _bar
 
         print('\t{}\t{}'.format(_barPaths[0], _barPaths[1]))
-        _barArrays = []
-        for i in range(2):
-            _barArrays.append(_barReader(_barPaths[i]))
-
-        _barArray = (_barArrays[1]*(timesteps[1] - ts0) -
-                     _barArrays[0]*(timesteps[0] - ts0)) / (timesteps[1] - timesteps[0])
+        dt = timesteps[1] - timesteps[0]
+        weights = [(timestep - ts0)/dt for timestep in timesteps]
+
+        def readAndScale(path, weight):
+            # Scaling in place pages in (and copies-on-write) the whole array,
+            # so each worker streams its own file from disk
+            array = _barReader(path)
+            np.multiply(array, weight, out=array)
+            return array
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            _barArrays = list(executor.map(readAndScale, _barPaths[:2], weights))
+        # Weighted difference done in place to avoid full-size temporaries
+        _barArray = np.subtract(_barArrays[1], _barArrays[0], out=_barArrays[1])
 
         print('Finished computing timestep window')
     else:
@@ -32,9 +32,14 @@ def binaryStsbar(stsbar_path) -> np.ndarray:
     """
     return readBinaryArray(stsbar_path, 6)
 
-def calcReynoldsStresses(stsbar_array, velbar_array, conservative_stresses=False) -> np.ndarray:
+def calcReynoldsStresses(stsbar_array, velbar_array, conservative_stresses=False,
+                         compute_col5=True, chunksize=2**16) -> np.ndarray:
     """Calculate Reynolds Stresses from velbar and stsbar data.
 
+    The stresses are computed in blocks of chunksize rows, so memory mapped
+    inputs (see vpt.readBinaryArray) are paged in and processed one block at a
+    time.
+
     Parameters
     ----------
     stsbar_array : ndarray
@@ -44,29 +49,44 @@ def calcReynoldsStresses(stsbar_array, velbar_array, conservative_stresses=False
     conservative_stresses : bool
         Whether the stsbar file used the
         'Conservative Stresses' option (default:False)
+    compute_col5 : bool
+        Whether to compute the last column of the Reynolds stress tensor from
+        conservative stsbar data. If False, it is set to zero. Only used if
+        conservative_stresses is True. (default: True)
+    chunksize : int
+        Number of rows processed at a time. (default: 2**16)
 
     Returns
     -------
     numpy.ndarray
     """
-    if conservative_stresses:
-        ReyStrTensor = np.empty((stsbar_array.shape[0], 6))
-        ReyStrTensor[:,0] = stsbar_array[:,3] - stsbar_array[:,0]**2
-        ReyStrTensor[:,1] = stsbar_array[:,4] - stsbar_array[:,1]**2
-        ReyStrTensor[:,2] = stsbar_array[:,5] - stsbar_array[:,2]**2
-        ReyStrTensor[:,3] = stsbar_array[:,6] - stsbar_array[:,0]*stsbar_array[:,1]
-        ReyStrTensor[:,4] = stsbar_array[:,7] - stsbar_array[:,1]*stsbar_array[:,2]
-        ReyStrTensor[:,5] = stsbar_array[:,8] - stsbar_array[:,0]*stsbar_array[:,2]
-        # ReyStrTensor[:,5] = np.zeros_like(ReyStrTensor[:,5])
-    else:
-        ReyStrTensor = np.empty((stsbar_array.shape[0], 6))
-
-        ReyStrTensor[:,0] = stsbar_array[:,0] - velbar_array[:,1]**2
-        ReyStrTensor[:,1] = stsbar_array[:,1] - velbar_array[:,2]**2
-        ReyStrTensor[:,2] = stsbar_array[:,2] - velbar_array[:,3]**2
-        ReyStrTensor[:,3] = stsbar_array[:,3] - velbar_array[:,1]*velbar_array[:,2]
-        ReyStrTensor[:,4] = stsbar_array[:,4] - velbar_array[:,1]*velbar_array[:,3]
-        ReyStrTensor[:,5] = stsbar_array[:,5] - velbar_array[:,2]*velbar_array[:,3]
+    ReyStrTensor = np.empty((stsbar_array.shape[0], 6))
+    ncols = 6 if compute_col5 else 5
+
+    for start in range(0, stsbar_array.shape[0], chunksize):
+        rows = slice(start, start + chunksize)
+        stsbar = stsbar_array[rows]
+        ReyStr = ReyStrTensor[rows]
+
+        if conservative_stresses:
+                # Build the mean products from the first three stsbar columns in
+                # ReyStr, then subtract them from the second moments in place
+            mean = stsbar[:,0:3]
+            np.multiply(mean, mean, out=ReyStr[:,0:3])
+            np.multiply(mean[:,0:2], mean[:,1:3], out=ReyStr[:,3:5])
+            if compute_col5:
+                np.multiply(mean[:,0], mean[:,2], out=ReyStr[:,5])
+            else:
+                ReyStr[:,5] = 0
+            np.subtract(stsbar[:,3:3+ncols], ReyStr[:,:ncols], out=ReyStr[:,:ncols])
+        else:
+                # Build the velocity products u_i*u_j in XX YY ZZ XY XZ YZ order
+                # in ReyStr, then subtract them from stsbar in place
+            vel = velbar_array[rows, 1:4]
+            np.multiply(vel, vel, out=ReyStr[:,0:3])
+            np.multiply(vel[:,0:2], vel[:,1:3], out=ReyStr[:,3:6:2])
+            np.multiply(vel[:,0], vel[:,2], out=ReyStr[:,4])
+            np.subtract(stsbar[:,0:6], ReyStr, out=ReyStr)
 
     return ReyStrTensor
 
@@ -104,9 +124,12 @@ def calcWallShearGradient(wall) -> np.ndarray:
         # reshape the gradient such that is is an array of rank 2 tensors
     grad_tensors = wall['gradient'].reshape(wall['gradient'].shape[0], 3, 3)
 
-    traction_vector = np.einsum('pkj,pj->pk', grad_tensors, wall['Normals'])
-    del_ik_nkni = np.identity(3) - np.einsum('pk,pi->pki', wall['Normals'], wall['Normals'])
-    wall_shear_gradient = np.einsum('pik,pk->pi', del_ik_nkni, traction_vector)
+    normals = wall['Normals']
+
+        # Batched matrix-vector product e_kj n_j
+    traction_vector = np.matmul(grad_tensors, normals[:,:,None])[:,:,0]
+        # (delta_ik - n_k n_i) t_k == t_i - (n_k t_k) n_i
+    wall_shear_gradient = traction_vector - np.einsum('pk,pk->p', normals, traction_vector)[:,None] * normals
 
     return wall_shear_gradient
 
@@ -139,29 +162,23 @@ def calcCf(wall, Uref, nu, rho, plane_normal='XY') -> np.ndarray:
     mu = nu * rho
 
     wall_shear_gradient = calcWallShearGradient(wall)
+    normals = wall['Normals']
 
+        # Project tangential gradient vector onto the chosen plane and take its
+        # streamwise component. Since the plane normal is a Cartesian axis, the
+        # projection n x (T_w x n) only drops the T_w component along that axis,
+        # so the dot product with the streamwise vector only needs the other two.
     if plane_normal.lower() == 'xy':
-        plane_normal = np.array([0,0,1])
-        streamwise_vectors = np.array([wall['Normals'][:,1],
-                                       -wall['Normals'][:,0],
-                                       np.zeros_like(-wall['Normals'][:,0])]).T
+        # streamwise vector: [n_y, -n_x, 0]
+        Tw = normals[:,1]*wall_shear_gradient[:,0] - normals[:,0]*wall_shear_gradient[:,1]
     elif plane_normal.lower() == 'xz':
-        plane_normal = np.array([0,1,0])
-        streamwise_vectors = np.array([wall['Normals'][:,2],
-                                       np.zeros_like(-wall['Normals'][:,0]),
-                                       -wall['Normals'][:,0]]).T
+        # streamwise vector: [n_z, 0, -n_x]
+        Tw = normals[:,2]*wall_shear_gradient[:,0] - normals[:,0]*wall_shear_gradient[:,2]
     elif plane_normal.lower() == 'yz':
-        plane_normal = np.array([1,0,0])
-        streamwise_vectors = np.array([wall['Normals'][:,2],
-                                       np.zeros_like(-wall['Normals'][:,0]),
-                                       -wall['Normals'][:,0]]).T
-
-        # Project tangential gradient vector onto the chosen plane using n x (T_w x n)
-    Tw = mu * np.cross(plane_normal[None,:],
-                       np.cross(wall_shear_gradient, plane_normal[None,:]))
-    Tw = np.einsum('ej,ej->e', streamwise_vectors, Tw)
+        # streamwise vector: [n_z, 0, -n_x]
+        Tw = -normals[:,0]*wall_shear_gradient[:,2]
 
-    Cf = Tw / (0.5*rho*Uref**2)
+    Cf = Tw * (mu / (0.5*rho*Uref**2))
     return Cf
 
 def compute_vorticity(dataset, scalars, vorticity_name='vorticity'):
@@ -224,6 +241,7 @@ def sampleDataBlockProfile(dataBlock, line_walldists, pointid=None,
     """
 
     wall = dataBlock['wall']
+    grid = dataBlock['grid']
 
     if 'Normals' not in wall.array_names:
         raise RuntimeError('The wall object must have a "Normals" field present.')
@@ -232,13 +250,12 @@ def sampleDataBlockProfile(dataBlock, line_walldists, pointid=None,
 
     if isinstance(pointid, int):
         wallnormal = wall['Normals'][pointid,:] if normal is None else normal
-        wallnormal = np.tile(wallnormal, (len(line_walldists),1))
 
         sample_points = line_walldists[:, None] * wallnormal
         sample_points += wall.points[pointid]
 
         sample_line = pv.lines_from_points(sample_points)
-        sample_line = sample_line.sample(dataBlock['grid'])
+        sample_line = sample_line.sample(grid)
         sample_line['WallDistance'] = line_walldists
 
     else:
@@ -257,7 +274,7 @@ def sampleDataBlockProfile(dataBlock, line_walldists, pointid=None,
         sample_points += cutterout.points
 
         sample_line = pv.lines_from_points(sample_points)
-        sample_line = sample_line.sample(dataBlock['grid'])
+        sample_line = sample_line.sample(grid)
         sample_line['WallDistance'] = line_walldists
 
         sample_line = Profile(sample_line)
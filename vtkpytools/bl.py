@@ -123,15 +123,18 @@ def delta_vortInt(vorticity, wall_distance, nwallpnts: int, displace=False,
     U = -cumtrapz(vorticity, wall_distance, initial=0, axis=1)
     Uedge = U[:, -1] if Uedge is None else Uedge
 
-    delta_displace_lambda = lambda: -(1/Uedge) * np.trapz(wall_distance*vorticity, wall_distance, axis=1)
-
     results = {}
+    if displace or momentum:
+            # y*vorticity is shared by both integrands, and momentum needs the
+            # displacement thickness regardless
+        integrand = wall_distance*vorticity
+        delta_displace = -(1/Uedge) * np.trapz(integrand, wall_distance, axis=1)
     if displace:
-        delta_displace = delta_displace_lambda()
         results['delta_displace'] = delta_displace
     if momentum:
-        delta_momentum = -(2/Uedge**2) * np.trapz(U*wall_distance*vorticity, wall_distance, axis=1)
-        delta_momentum -= delta_displace if displace else delta_displace_lambda()
+        integrand = integrand*U
+        delta_momentum = -(2/Uedge**2) * np.trapz(integrand, wall_distance, axis=1)
+        delta_momentum -= delta_displace
 
         results['delta_momentum'] = delta_momentum
     if returnUvort:
@@ -194,17 +197,18 @@ def delta_velInt(U, wall_distance, nwallpnts: int,
 
     Uedge = U[:, -1] if Uedge is None else Uedge
 
-    delta_displace_lambda = lambda : np.trapz((1 - U/Uedge[:,None]), wall_distance, axis=1)
-    delta_momentum_lambda = lambda : np.trapz((1 - U/Uedge[:,None])*(U/Uedge[:,None]), wall_distance, axis=1)
-
-    if displace and not momentum:
-        return {'delta_displace': delta_displace_lambda()}
-    elif not displace and momentum:
-        return {'delta_momentum': delta_momentum_lambda()}
-    elif displace and momentum:
-        return {'delta_displace': delta_displace_lambda(), 'delta_momentum': delta_momentum_lambda()}
-    else:
-        return {}
+    results = {}
+    if displace or momentum:
+            # 1 - U/Uedge is shared by both integrands, formed in one buffer
+        Unorm_deficit = U/Uedge[:,None]
+        np.subtract(1, Unorm_deficit, out=Unorm_deficit)
+        weights = _trapzWeights(wall_distance)
+    if displace:
+        results['delta_displace'] = np.einsum('ij,ij->i', Unorm_deficit, weights)
+    if momentum:
+        Unorm = 1 - Unorm_deficit
+        results['delta_momentum'] = np.einsum('ij,ij,ij->i', Unorm_deficit, Unorm, weights)
+    return results
 
 
 def delta_percent(U, wall_distance, nwallpnts: int, percent: float, Uedge=None) -> ndarray:
@@ -255,6 +259,20 @@ def delta_percent(U, wall_distance, nwallpnts: int, percent: float, Uedge=None)
     return wall_distance[W, index-1] + (percent*Uedge - U[W, index-1])*slopes
 
 
+def _trapzWeights(x) -> ndarray:
+    """Trapezoidal rule weights for sample locations x along the last axis
+
+    Integrating y over x is then a weighted sum, equivalent to
+    np.trapz(y, x, axis=-1) == np.sum(y*_trapzWeights(x), axis=-1)
+    """
+    dx = np.diff(x, axis=-1)
+    weights = np.zeros(x.shape)
+    weights[..., :-1] = dx
+    weights[..., 1:] += dx
+    weights *= 0.5
+    return weights
+
+
 def integratedVortBLThickness(vorticity, wall_distance, delta_percent=0.995,
                          delta_displace=False, delta_momentum=False) -> dict:
     """(DEPRECATED) Computes vorticity-integrated BL thickness for a profile"""
@@ -1,7 +1,6 @@
 import vtk
 import pyvista as pv
 import numpy as np
-from scipy.io import FortranFile
 from pathlib import Path
 import re
 from packaging import version
@@ -69,6 +68,11 @@ class Profile(pv.PolyData):
 def readBinaryArray(path, ncols) -> np.ndarray:
     """Get array from Fortran binary file.
 
+    The file is expected to hold a single unformatted record of float64
+    values. The record is memory mapped (copy-on-write), so data is only paged
+    in from disk as it is accessed and modifying the array does not change the
+    file.
+
     Parameters
     ----------
 
@@ -76,9 +80,28 @@ def readBinaryArray(path, ncols) -> np.ndarray:
         Path to Fortran binary array.
     ncols : uint
         Number of columns in the binary file.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (nrows, ncols). The record is stored node-major (the
+        ncols values of each node are adjacent), so this is a view of the
+        mapped record rather than a copy.
     """
-    array = FortranFile(path, 'r')
-    array = array.read_reals()
+    with open(path, 'rb') as file:
+            # Fortran unformatted records are wrapped by a 4-byte length marker
+        nbytes = np.fromfile(file, dtype=np.uint32, count=1)
+        if nbytes.size != 1:
+            raise RuntimeError('Could not read record marker from {}'.format(path))
+        nbytes = int(nbytes[0])
+
+        file.seek(4 + nbytes)
+        footer = np.fromfile(file, dtype=np.uint32, count=1)
+        if nbytes % 8 != 0 or footer.size != 1 or footer[0] != nbytes:
+            raise RuntimeError('Size of record in {} does not match its record '
+                               'markers. File may be corrupt.'.format(path))
+
+    array = np.memmap(path, dtype=np.float64, mode='c', offset=4, shape=(nbytes//8,))
     nrows = int(array.shape[0]/ncols)
     array = np.reshape(array, (nrows, ncols))
 
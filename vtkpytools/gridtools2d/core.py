@@ -111,8 +111,9 @@ def computeEdgeNormals(edges, domain_point) -> pv.PolyData:
     normals = np.zeros((edges.n_cells, 3))
         # Indices of 2 points forming line cell
     indices = edges.lines.reshape((edges.n_cells, 3))[:,1:3]
-    pnts1 = edges.points[indices[:,0], :]
-    pnts2 = edges.points[indices[:,1], :]
+    points = edges.points
+    pnts1 = points[indices[:,0], :]
+    pnts2 = points[indices[:,1], :]
 
     normals[:, 0:2] = np.array([-(pnts1[:,1] - pnts2[:,1]), (pnts1[:,0] - pnts2[:,0])]).T
 
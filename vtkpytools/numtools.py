@@ -1,6 +1,11 @@
 """Module of generic numerical tools """
 import numpy as np
 
+# Contraction path for rotating rank 2 tensors in rotateTensor. It does not
+# depend on the number of tensors, so it is only planned once.
+_RANK2_ROTATION_PATH = np.einsum_path('ik,ekl,jl->eij', np.empty((3,3)), np.empty((1,3,3)),
+                                      np.empty((3,3)), optimize='optimal')[0]
+
 
 def getGeometricSeries(maxval, minval, growthrate, include_zero=True) -> np.ndarray:
     """Return geometric progression based on inputs.
@@ -41,7 +46,7 @@ def getGeometricSeries(maxval, minval, growthrate, include_zero=True) -> np.ndar
     """
     # Calculate the number of points required to reach maxval
     npoints = np.log((maxval*(growthrate-1))/minval)/np.log(growthrate)
-    npoints = np.floor(npoints).astype(np.int32)
+    npoints = int(np.floor(npoints))
 
     # Calculate the values of dn_i
     if include_zero:
@@ -52,7 +57,7 @@ def getGeometricSeries(maxval, minval, growthrate, include_zero=True) -> np.ndar
         geomseries[:-1]  = minval*growthrate**np.arange(npoints)
 
     # Sum the dn_i together to get n_i
-    geomseries = np.cumsum(geomseries)
+    np.cumsum(geomseries, out=geomseries)
 
     geomseries[-1] = maxval
 
@@ -203,10 +208,12 @@ def rotateTensor(tensor_array, rotation_tensor) -> np.ndarray:
     """
 
     def rank2Rotation(rot_tensor, shaped_tensors):
-        return np.einsum('ik,ekl,jl->eij', rot_tensor, shaped_tensors, rot_tensor)
+        return np.einsum('ik,ekl,jl->eij', rot_tensor, shaped_tensors, rot_tensor,
+                         optimize=_RANK2_ROTATION_PATH)
 
     if tensor_array.shape[1] == 3 and tensor_array.ndim == 2:
-        return np.einsum('ij,ej->ei', rotation_tensor, tensor_array)
+        # R_ij v_ej == (v R^T)_ei, a single GEMM through BLAS
+        return tensor_array @ rotation_tensor.T
 
     elif (tensor_array.ndim == 3 and
           all(dimsize == 3 for dimsize in tensor_array.shape[1:]) ):